@@ -1,20 +1,40 @@
 import argparse
+import asyncio
+import atexit
 import logging
+import mmap
 import os
+import re
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
-from functools import wraps
+from functools import lru_cache, partial, wraps
+from pathlib import PurePosixPath
 from time import time
 
 import numpy as np
 from osgeo import gdal  # type: ignore
 from sardem import cop_dem
 import sarsen
+import orjson
 import pystac
-import json
+import pystac.stac_io
 import zipfile
 
 __version__ = "1.0.0"
 
+# Register every GDAL driver once at import and skip the exotic ones we never
+# open, so later gdal.Open/gdal.Translate calls don't probe them. GDAL only
+# honors GDAL_SKIP while registering, so the option must be set before
+# AllRegister (which deregisters the skipped drivers from the import-time
+# registration). Point GDAL's scratch space at tmpfs when available.
+gdal.UseExceptions()
+gdal.SetConfigOption("GDAL_SKIP", "JP2ECW JP2MrSID MrSID")
+gdal.AllRegister()
+if os.path.isdir("/dev/shm"):
+    gdal.SetConfigOption("CPL_TMPDIR", "/dev/shm")
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(name)s] [%(levelname)s] %(message)s",
@@ -32,26 +52,119 @@ class Args:
     stac_catalog_folder: str
     bbox: tuple[float, float, float, float]
     stac_asset_name: str
+    measurement_group: str
     out_dir: str
 
 
 def logtime(func):
     """Function decorator to log the time (seconds) a function takes to execute."""
 
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        start = time()
-        result = func(*args, **kwargs)
-        logger.info("%s: %.1f seconds", func.__name__, time() - start)
-        return result
+    if asyncio.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            start = time()
+            result = await func(*args, **kwargs)
+            logger.info("%s: %.1f seconds", func.__name__, time() - start)
+            return result
+
+    else:
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time()
+            result = func(*args, **kwargs)
+            logger.info("%s: %.1f seconds", func.__name__, time() - start)
+            return result
 
     return wrapper
 
+class OrjsonStacIO(pystac.stac_io.DefaultStacIO):
+    """StacIO that (de)serializes with orjson, markedly faster than stdlib json."""
+
+    def json_dumps(self, json_dict, *args, **kwargs):
+        return orjson.dumps(
+            json_dict, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+
+    def json_loads(self, txt, *args, **kwargs):
+        return orjson.loads(txt)
+
+
+pystac.stac_io.StacIO.set_default(OrjsonStacIO)
+
+
+# Below this size the mmap setup costs more than the buffered read it saves.
+_MMAP_THRESHOLD_BYTES = 64 * 1024
+
+
+@lru_cache(maxsize=None)
+def _load_json(path: str) -> dict:
+    """
+    Read and parse a JSON file, caching the result so each file is parsed at
+    most once per run.
+
+    Larger files are parsed straight out of a read-only mmap, skipping the
+    intermediate copy through Python's buffered I/O.
+    """
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size < _MMAP_THRESHOLD_BYTES:
+            return orjson.loads(file.read())
+        mapped = mmap.mmap(file.fileno(), 0, prot=mmap.PROT_READ)
+        view = memoryview(mapped)
+        try:
+            return orjson.loads(view)
+        finally:
+            view.release()
+            mapped.close()
+
+
+@lru_cache(maxsize=None)
+def _load_catalog(path: str) -> pystac.Catalog:
+    """Load a STAC catalog from a JSON file, caching the parsed catalog."""
+    return pystac.Catalog.from_dict(_load_json(path))
+
+
+@lru_cache(maxsize=None)
+def _load_item(path: str) -> pystac.Item:
+    """Load a STAC item from a JSON file, caching the parsed item."""
+    return pystac.Item.from_dict(_load_json(path))
+
+
+def _fresh_item(item: pystac.Item) -> pystac.Item:
+    """
+    Return a private copy of a STAC item via an orjson dict round-trip.
+
+    Markedly cheaper than Item.clone(), which deep-copies every Asset/Link
+    object; the round-trip also guarantees the copy shares no nested
+    structure with the cached original.
+    """
+    return pystac.Item.from_dict(orjson.loads(orjson.dumps(item.to_dict())))
+
+
+def _resolve_link(link, catalog_dir: str) -> str:
+    """
+    Resolve a STAC link target against the catalog directory.
+
+    PurePosixPath arithmetic avoids normpath's full string walk, and the
+    resolved string is cached on the link so a second pass over the same
+    (cached) catalog does no path work at all.
+    """
+    resolved = getattr(link, "_resolved", None)
+    if resolved is None:
+        resolved = str(PurePosixPath(catalog_dir) / link.target)
+        link._resolved = resolved
+    return resolved
+
+
 @logtime
-def get_s1_grd_path(json_file, stac_asset_name):
+async def get_s1_grd_path(json_file, stac_asset_name):
     """
     Fetches the paths of S1 GRD products from the STAC catalog.
 
+    The item files are independent small reads, so they are fanned out
+    concurrently instead of being read one at a time.
+
     Parameters
     ----------
     json_file : str
@@ -62,7 +175,8 @@ def get_s1_grd_path(json_file, stac_asset_name):
     Returns
     -------
     List[str]
-        List of paths of S1 GRD products.
+        List with the path of the first S1 GRD product found (the catalog
+        is expected to contain a single item), empty if none was found.
     """
     logger.info("Fetching S1 GRD product paths from the STAC catalog...")
 
@@ -70,25 +184,28 @@ def get_s1_grd_path(json_file, stac_asset_name):
 
     try:
         # Read catalog.json
-        with open(json_file, 'r') as file:
-            catalog_data = json.load(file)
-            catalog = pystac.Catalog.from_dict(catalog_data)
-
-        if catalog.links:
-            for link in catalog.links:
-                # Read item, should be only one
-                if link.rel == 'item':
-                    absolute_link_href = os.path.normpath(os.path.join(os.path.dirname(json_file), link.target))
-                    with open(absolute_link_href, 'r') as item_file:
-                        item_data = json.load(item_file)
-                        item = pystac.Item.from_dict(item_data)
-                        # get the asset
-                        if item.assets and stac_asset_name in item.assets:
-                            s1_grd_paths.append(os.path.normpath(os.path.join(os.path.dirname(absolute_link_href), item.assets[stac_asset_name].href)))
-                        else:
-                            logger.warning(f"No '{stac_asset_name}' asset found in item {absolute_link_href}")
-        else:
-            logger.warning("No links found in the STAC catalog.")
+        catalog = _load_catalog(json_file)
+        catalog_dir = os.path.dirname(json_file)
+
+        # Filter down to item links before doing any per-link I/O.
+        item_links = [link for link in (catalog.links or []) if link.rel == 'item']
+        if not item_links:
+            logger.warning("No item links found in the STAC catalog.")
+
+        # Read each item concurrently, should be only one
+        item_paths = [_resolve_link(link, catalog_dir) for link in item_links]
+        items = await asyncio.gather(
+            *(asyncio.to_thread(_load_item, item_path) for item_path in item_paths)
+        )
+        for absolute_link_href, item in zip(item_paths, items):
+            item_dir = os.path.dirname(absolute_link_href)
+            # get the asset
+            if item.assets and stac_asset_name in item.assets:
+                s1_grd_paths.append(str(PurePosixPath(item_dir) / item.assets[stac_asset_name].href))
+                # Should be only one product per catalog; stop scanning once found
+                break
+            else:
+                logger.warning(f"No '{stac_asset_name}' asset found in item {absolute_link_href}")
 
     except Exception as e:
         logger.error(f"Error fetching S1 GRD product paths: {e}")
@@ -116,10 +233,33 @@ def get_dem(bbox: tuple[float, float, float, float], out_dir: str) -> str:
     """
     logger.info("Downloading DEM from Copernicus...")
     dem_file = os.path.join(out_dir, "dem.tif")
+    tmp_file = dem_file + ".tmp"
     try:
         cop_dem.download_and_stitch(
-            dem_file, bbox, output_format="GTiff"
+            tmp_file, bbox, output_format="GTiff"
         )
+        # Rewrite the stripped GeoTIFF as a tiled Cloud-Optimized GeoTIFF:
+        # SARsen's terrain correction reads the DEM non-sequentially, and
+        # 256x256 tiles match that access pattern far better than row-strips.
+        # Overviews are built first so COPY_SRC_OVERVIEWS bakes them in.
+        dem = gdal.Open(tmp_file, gdal.GA_Update)
+        dem.BuildOverviews("AVERAGE", [2, 4, 8, 16])
+        dem = None
+        gdal.Translate(
+            dem_file,
+            tmp_file,
+            creationOptions=[
+                "TILED=YES",
+                "BLOCKXSIZE=256",
+                "BLOCKYSIZE=256",
+                "COMPRESS=DEFLATE",
+                # cop_dem writes Int16 samples; predictor 2 is the one for
+                # integer data (3 is floating-point only and libtiff rejects it)
+                "PREDICTOR=2",
+                "COPY_SRC_OVERVIEWS=YES",
+            ],
+        )
+        os.remove(tmp_file)
     except Exception as e:
         logger.error(f"Error downloading DEM: {e}")
         dem_file = ""
@@ -128,7 +268,7 @@ def get_dem(bbox: tuple[float, float, float, float], out_dir: str) -> str:
 
 
 @logtime
-def run_sarsen(s1_file: str, dem_file: str, output_dir: str) -> str:
+def run_sarsen(s1_file: str, dem_file: str, output_dir: str, measurement_group: str = "IW/VV") -> str:
     """
     Runs SARsen processing on a Sentinel-1 GRD product and a DEM.
 
@@ -140,6 +280,8 @@ def run_sarsen(s1_file: str, dem_file: str, output_dir: str) -> str:
         Path to the DEM file.
     output_dir : str
         Path to the output directory.
+    measurement_group : str
+        SARsen measurement group to process (for example "IW/VV").
 
     Returns
     -------
@@ -152,7 +294,7 @@ def run_sarsen(s1_file: str, dem_file: str, output_dir: str) -> str:
     )
     try:
         product = sarsen.Sentinel1SarProduct(
-            s1_file, measurement_group="IW/VV"
+            s1_file, measurement_group=measurement_group
         )
         sarsen.terrain_correction(
             product, output_urlpath=output_file, dem_urlpath=dem_file,correct_radiometry="gamma_nearest"
@@ -162,12 +304,102 @@ def run_sarsen(s1_file: str, dem_file: str, output_dir: str) -> str:
         output_file = ""
     return output_file
 
-def extract_zip(zip_file):
+def _extract_members(zip_file, members, temp_dir):
+    """Extract a batch of members from zip_file into temp_dir using a private ZipFile handle."""
+    with zipfile.ZipFile(zip_file, "r") as zip_ref:
+        for member in members:
+            zip_ref.extract(member, temp_dir)
+
+
+def prefetch_file(path: str):
+    """
+    Ask the kernel to prefetch a file into the page cache.
+
+    Maps the file read-only and issues madvise(MADV_WILLNEED), so later
+    reads (e.g. SARsen's DEM tile fetches) hit memory instead of stalling
+    on disk. Keep the returned mmap alive while the prefetch should remain
+    effective.
+
+    Parameters
+    ----------
+    path : str
+        Path to the file to prefetch.
+
+    Returns
+    -------
+    mmap.mmap
+        The read-only mapping, or None if the file could not be mapped.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            mapped = mmap.mmap(fd, 0, prot=mmap.PROT_READ)
+        finally:
+            os.close(fd)
+        mapped.madvise(mmap.MADV_WILLNEED)
+        return mapped
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not prefetch {path}: {e}")
+        return None
+
+
+def configure_gdal():
+    """
+    Tune GDAL once for the whole run.
+
+    GDAL defaults to a 40 MB block cache and single-threaded warp/decode,
+    which starves SARsen's terrain correction. Raise the block cache, let
+    GDAL use every core, widen the dataset pool, and cache VSI reads in
+    memory.
+    """
+    gdal.SetCacheMax(4 * 1024**3)
+    gdal.SetConfigOption("GDAL_NUM_THREADS", "ALL_CPUS")
+    gdal.SetConfigOption("GDAL_MAX_DATASET_POOL_SIZE", "512")
+    gdal.SetConfigOption("GDAL_TIFF_INTERNAL_MASK", "YES")
+    gdal.SetConfigOption("VSI_CACHE", "TRUE")
+    gdal.SetConfigOption("VSI_CACHE_SIZE", "268435456")
+    gdal.SetConfigOption("CPL_VSIL_CURL_CACHE_SIZE", "268435456")
+    # cop_dem stitches the DEM from remote Copernicus tiles through a VRT,
+    # so the tile fetches happen inside GDAL: multiplex them over HTTP/2
+    # with retries instead of issuing one request at a time.
+    gdal.SetConfigOption("GDAL_HTTP_MULTIPLEX", "YES")
+    gdal.SetConfigOption("GDAL_HTTP_VERSION", "2")
+    gdal.SetConfigOption("GDAL_HTTP_MAX_RETRY", "3")
+    gdal.SetConfigOption("GDAL_HTTP_RETRY_DELAY", "1")
+    gdal.SetConfigOption("CPL_VSIL_CURL_CHUNK_SIZE", "1048576")
+
+
+def _safe_member_pattern(measurement_group):
+    """
+    Build the regex matching the SAFE members SARsen reads for a measurement group.
+
+    Only the manifest, the measurement TIFF and the (calibration) annotation
+    XMLs of the requested group (for example "IW/VV" -> "iw.*vv") are kept.
+    """
+    group_pattern = ".*".join(re.escape(part) for part in measurement_group.lower().split("/"))
+    return re.compile(
+        r"^[^/]+\.SAFE/(manifest\.safe|(measurement|annotation(/calibration)?)/.*"
+        + group_pattern
+        + r".*)",
+        re.IGNORECASE,
+    )
+
+
+def extract_zip(zip_file, measurement_group="IW/VV"):
     """
-    Extract a zip file.
+    Extract the subproducts of a zipped SAFE archive that SARsen reads.
+
+    Only the manifest and the measurement/annotation files of the requested
+    measurement group are extracted -- often a small fraction of the archive
+    bytes. The members are split into batches extracted by a thread pool:
+    zlib decompression and the file writes both release the GIL, which
+    overlaps the many small write() calls instead of issuing them one at a
+    time.
 
     Args:
         zip_file: Path to the zip file.
+        measurement_group: SARsen measurement group (for example "IW/VV")
+            used to filter the archive members.
 
     Returns:
         The absolute path of the unzipped file.
@@ -175,10 +407,38 @@ def extract_zip(zip_file):
     logger.info(f"Extracting zip file: {zip_file}")
     try:
         with zipfile.ZipFile(zip_file, "r") as zip_ref:
-            # Create a temporary directory to extract the zip file
-            temp_dir = os.path.abspath("temp_extract")
-            os.makedirs(temp_dir, exist_ok=True)
-            zip_ref.extractall(temp_dir)
+            # Create a temporary directory private to this product, so
+            # concurrent extractions never clobber each other's files.
+            temp_dir = tempfile.mkdtemp(
+                prefix=f"{os.path.basename(zip_file).replace('.zip', '')}_"
+            )
+            atexit.register(shutil.rmtree, temp_dir, ignore_errors=True)
+            member_pattern = _safe_member_pattern(measurement_group)
+            members = [
+                member
+                for member in zip_ref.infolist()
+                if member.is_dir() or member_pattern.match(member.filename)
+            ]
+
+            # Pre-create the directory tree so the worker threads never race
+            # on makedirs while extracting files.
+            for member in members:
+                member_dir = os.path.dirname(member.filename.rstrip("/"))
+                if member.is_dir():
+                    member_dir = member.filename
+                if member_dir:
+                    os.makedirs(os.path.join(temp_dir, member_dir), exist_ok=True)
+
+            file_members = [member for member in members if not member.is_dir()]
+            num_workers = max(1, min(8, os.cpu_count(), len(file_members)))
+            batches = [file_members[i::num_workers] for i in range(num_workers)]
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                for future in [
+                    executor.submit(_extract_members, zip_file, batch, temp_dir)
+                    for batch in batches
+                ]:
+                    future.result()
+
             # Get the list of extracted files
             extracted_files = os.listdir(temp_dir)
             if extracted_files:
@@ -219,6 +479,14 @@ def parse_args() -> Args:
         metavar="stac_asset_name",
         required=False,
     )
+    parser.add_argument(
+        "--measurement_group",
+        type=str,
+        help="SARsen measurement group to process. Default: IW/VV",
+        default="IW/VV",
+        metavar="measurement_group",
+        required=False,
+    )
     parser.add_argument(
         "-o",
         "--out_dir",
@@ -233,18 +501,23 @@ def parse_args() -> Args:
 
     return Args(
         stac_catalog_folder=raw_args.stac_catalog_folder,
-        bbox=raw_args.bbox,
+        bbox=tuple(raw_args.bbox),
         stac_asset_name=raw_args.stac_asset_name,
+        measurement_group=raw_args.measurement_group,
         out_dir=raw_args.out_dir,
     )
 
+@lru_cache(maxsize=16)
 def bbox_to_geojson(bbox):
     """
     Convert bbox to GeoJSON geometry.
-    
+
+    The result is cached per bbox tuple and shared between callers, so it
+    must be treated as read-only.
+
     Parameters:
-    bbox (list): A list of 4 coordinates representing the bounding box [min_lon, min_lat, max_lon, max_lat]
-    
+    bbox (tuple): A tuple of 4 coordinates representing the bounding box (min_lon, min_lat, max_lon, max_lat)
+
     Returns:
     dict: A GeoJSON geometry dictionary
     """
@@ -278,24 +551,17 @@ def retrieve_stac_item_by_rel(stac_catalog_file, stac_item_rel):
     """
     try:
         # Read catalog.json
-        with open(stac_catalog_file, 'r') as file:
-            catalog_data = json.load(file)
-            catalog = pystac.Catalog.from_dict(catalog_data)
+        catalog = _load_catalog(stac_catalog_file)
+        catalog_dir = os.path.dirname(stac_catalog_file)
 
-        if not catalog.links:
-            logger.warning("No links found in the STAC catalog.")
+        # Filter down to links with the provided rel before doing any I/O.
+        matching_links = [link for link in (catalog.links or []) if link.rel == stac_item_rel]
+        if not matching_links:
+            logger.warning(f"No '{stac_item_rel}' links found in the STAC catalog.")
             return None
 
-        for link in catalog.links:
-            # Read item with the provided rel
-            if link.rel != stac_item_rel:
-                continue
-
-            absolute_link_href = os.path.normpath(os.path.join(os.path.dirname(stac_catalog_file), link.target))
-
-            with open(absolute_link_href, 'r') as item_file:
-                item_data = json.load(item_file)
-                return pystac.Item.from_dict(item_data)
+        # Read the first matching item
+        return _load_item(_resolve_link(matching_links[0], catalog_dir))
 
     except Exception as e:
         logger.error(f"Error retrieving the STAC item: {e}")
@@ -360,44 +626,75 @@ def create_stage_out_catalog(output_dir, output_stac_item, bbox, asset_name, ass
     return output_stac_catalog
 
 @logtime
-def main() -> None:
+async def main() -> None:
     """
         Main function to execute the OGC application.
 
         Steps:
         1. Parse arguments
         2. Get S1 GRD product paths
-        3. Download DEM
+        3. Download DEM, overlapped with extraction of the S1 GRD products
         4. Run SARsen
         5. Create the STAC catalog for stage out of the processor outputs
     """
-    # Step 1: Parse arguments
+    # Step 1: Parse arguments and tune GDAL before any dataset is touched
+    configure_gdal()
     args = parse_args()
 
     # Step 2: Get S1 GRD product paths
     catalog_path = os.path.join(args.stac_catalog_folder,"catalog.json")
-    s1_grd_paths = get_s1_grd_path(catalog_path, args.stac_asset_name)
-
-    # Step 3: Download DEM
-    dem_file = get_dem(args.bbox, args.out_dir)
-
-    # Step 4: Run SARsen for each S1 GRD product
-    output_files = []
-    for s1_grd_path in s1_grd_paths:
-        extracted_s1_grd_path = extract_zip(s1_grd_path)
-        if extracted_s1_grd_path:
-            output_files.append(run_sarsen(extracted_s1_grd_path, dem_file, args.out_dir))
-        else:
+    s1_grd_paths = await get_s1_grd_path(catalog_path, args.stac_asset_name)
+
+    # Step 3: Download DEM. The download is network-bound and the zip
+    # extraction is disk/CPU-bound with no shared data, so run them
+    # concurrently; only run_sarsen needs both results.
+    dem_task = asyncio.create_task(
+        asyncio.to_thread(get_dem, args.bbox, args.out_dir)
+    )
+    extract_tasks = [
+        asyncio.to_thread(extract_zip, s1_grd_path, args.measurement_group)
+        for s1_grd_path in s1_grd_paths
+    ]
+    dem_file, *extracted_s1_grd_paths = await asyncio.gather(
+        dem_task, *extract_tasks
+    )
+    for s1_grd_path, extracted_s1_grd_path in zip(s1_grd_paths, extracted_s1_grd_paths):
+        if not extracted_s1_grd_path:
             logger.error("Error extracting zip file for %s", s1_grd_path)
-            continue
+    extracted_s1_grd_paths = [path for path in extracted_s1_grd_paths if path]
+
+    # Prefetch the DEM into the page cache so SARsen's first tile reads
+    # don't stall on disk; the mapping stays alive through step 4.
+    dem_map = prefetch_file(dem_file) if dem_file else None
+
+    # Step 4: Run SARsen for each S1 GRD product. The products are fully
+    # independent, so process each one in its own worker process.
+    run = partial(
+        run_sarsen,
+        dem_file=dem_file,
+        output_dir=args.out_dir,
+        measurement_group=args.measurement_group,
+    )
+    with ProcessPoolExecutor(
+        max_workers=max(1, min(len(extracted_s1_grd_paths), os.cpu_count()))
+    ) as executor:
+        output_files = list(executor.map(run, extracted_s1_grd_paths))
+
+    if dem_map is not None:
+        dem_map.close()
+    output_files = [output_file for output_file in output_files if output_file]
     logger.info("SARSEN process completed for all S1 GRD products.")
 
+    if not output_files:
+        logger.error("No SARsen output was produced, skipping stage out.")
+        return
+
     # Step 5: Create the STAC catalog for stage out of the processor outputs
-    create_stage_out_catalog(args.out_dir, 
-                             retrieve_stac_item_by_rel(catalog_path, "item").clone(), 
+    create_stage_out_catalog(args.out_dir,
+                             _fresh_item(retrieve_stac_item_by_rel(catalog_path, "item")),
                              args.bbox,
                              args.stac_asset_name,
                              output_files[0])
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())